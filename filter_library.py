@@ -1,3 +1,4 @@
+import functools
 import math
 
 import numpy as np
@@ -5,6 +6,21 @@ import numpy as np
 from scipy import signal
 from scipy.fft import fft, ifft
 
+# One period of each LFO shape, tabulated once at import. Building an
+# LFO is then a table lookup by wrapped phase instead of re-evaluating
+# trig over the whole signal on every effect click. At 4096 points the
+# quantization works out to well under a sample of delay.
+_LFO_TABLE_SIZE = 4096
+_LFO_PHASE = np.arange(_LFO_TABLE_SIZE, dtype=np.float32) / _LFO_TABLE_SIZE
+_LFO_TABLES = {
+    # Rises -1 to 1 over the first half period, falls back over the
+    # second.
+    'triangle': (1 - 2 * np.abs(2 * _LFO_PHASE - 1)).astype(np.float32),
+    # Rises -1 to 1 over the full period.
+    'saw': (2 * _LFO_PHASE - 1).astype(np.float32),
+    'sin': np.sin(2 * np.pi * _LFO_PHASE).astype(np.float32),
+}
+
 def _trim_convolution(audioin: np.ndarray) -> np.ndarray:
     """Trim off the back half of an array.
 
@@ -24,26 +40,74 @@ def _trim_convolution(audioin: np.ndarray) -> np.ndarray:
     np.ndarray
         The first n points of `audioin`.
     """
+    half_length = (len(audioin) + 1) // 2
+
+    # Slicing gives back a zero-copy view, so there's no need to build
+    # an index list or copy the tail just to throw it away.
+    return audioin[:half_length]
+
+def _partitioned_conv(
+        audioin: np.ndarray, kernel: np.ndarray,
+        first_partition: int = 64
+    ) -> np.ndarray:
+    """Convolve a signal against a kernel split into partitions.
+
+    Partitioned overlap-add: the kernel is sliced into pieces whose
+    lengths start at `first_partition` and double from there, each
+    piece is convolved separately with overlap-add, and the results
+    are summed at the right offsets. Small early partitions keep the
+    hottest FFT blocks cache-resident, and no single transform ever
+    spans the whole kernel. Partitions that are entirely zero (common
+    for sparse combs) are skipped outright. Output is trimmed to the
+    length of `audioin`.
+
+    Parameters
+    ----------
+    audioin: np.ndarray
+        Audio input, x[n].
+
+    kernel: np.ndarray
+        Impulse response to convolve against.
+
+    first_partition: int
+        Length of the first partition; subsequent partitions double.
+
+    Returns
+    -------
+    np.ndarray
+        First n points of (x * kernel)[n].
+    """
     length = len(audioin)
-    half_length = (length + 1) // 2
+    audioout = np.zeros(length, dtype=np.float32)
 
-    index_list = [x for x in range(half_length, length)]
+    start = 0
+    size = first_partition
+    while start < len(kernel) and start < length:
+        partition = kernel[start:start + size]
 
-    trimmed = np.delete(audioin, index_list)
+        # Convolving against the partition and shifting by its offset
+        # is the same as convolving against the zero-padded kernel.
+        if partition.any():
+            segment = signal.oaconvolve(audioin, partition)
+            audioout[start:] += segment[:length - start]
 
-    return trimmed
+        start += size
+        size *= 2
+
+    return audioout
 
 def delay_effect(
         audioin: np.ndarray, echoes: int, delay: float,
-        samplerate: int = 44_100
+        samplerate: int = 44_100, out: np.ndarray = None
     ) -> np.ndarray:
     """"Add one or more echoes to a signal without increasing duration.
     
-    The effect is achieved by convolving x[n] with a Dirac comb D[n]
-    that has been attenuated by a sharp decay function. To keep the
-    operation from increasing (read: doubling) the duration, the result
-    of the convolution is pruned back to the first n points using the
-    _trim_convolution helper function.
+    Mathematically the effect is a convolution of x[n] with a Dirac
+    comb D[n] that has been attenuated by a sharp decay function. But
+    since D[n] only has `echoes` + 1 nonzero points, computing the full
+    convolution is wasteful -- instead each echo is added directly as a
+    shifted, attenuated copy of x[n]. Only the first n points of each
+    copy are kept, so the duration of the signal never grows.
 
     Parameters
     ----------
@@ -58,32 +122,75 @@ def delay_effect(
 
     samplerate: int
         The sampling rate in Hz of the input signal.
-    
+
+    out: np.ndarray
+        Optional float32 output buffer of the same length as
+        `audioin`. Callers that apply effects repeatedly can recycle
+        a buffer here instead of paying for a fresh allocation per
+        call. Must not overlap `audioin`.
+
     Returns
     -------
     np.ndarray
         First n points of (x * D)[n].
     """
+    # Work in float32: audio hardware hands us float32 anyway, and
+    # half-width samples halve the memory traffic of every pass below.
+    audioin = np.ascontiguousarray(audioin, dtype=np.float32)
+
     # Convert delay from seconds to samples.
     delay = math.floor(delay * samplerate)
 
-    # Each echo is a Dirac impulse with a decaying height.
-    comb = np.zeros(len(audioin))
-    for j in range(echoes + 1):
-        if delay * j <= len(audioin):
-            comb[delay * j] = math.exp(-j)
-
-    # Calculate the (2n-1) point convolution.
-    audioout = signal.fftconvolve(audioin, comb)
-
-    # Prune the convolution to n points.
-    audioout = _trim_convolution(audioout)
+    length = len(audioin)
 
-    return audioout
+    # With a handful of echoes (the GUI allows at most 8) the comb is
+    # extremely sparse, and direct shift-and-add wins easily.
+    if echoes < 32:
+        # The j = 0 impulse is just the dry signal.
+        if out is None:
+            audioout = audioin.copy()
+        else:
+            audioout = out
+            np.copyto(audioout, audioin)
+
+        # One vectorized call computes every echo's attenuation, so no
+        # transcendental evaluations are left inside the loop.
+        decay = np.exp(-np.arange(1, echoes + 1, dtype=np.float32))
+
+        # Each echo is an exponentially attenuated copy of the signal
+        # shifted right by j * delay samples -- a single vectorized
+        # multiply-add per echo, rather than an FFT over the whole
+        # signal.
+        for j in range(1, echoes + 1):
+            offset = delay * j
+            if offset < length:
+                audioout[offset:] += (
+                    decay[j - 1] * audioin[:length - offset]
+                )
+
+        return audioout
+
+    # For dense combs, fall back to partitioned overlap-add
+    # convolution. The comb is built only out to its last impulse, so
+    # no partition is wasted on trailing zeros.
+    support = min(delay * echoes + 1, length)
+    j = np.arange(echoes + 1)
+    positions = delay * j
+    in_bounds = positions < support
+
+    comb = np.zeros(support, dtype=np.float32)
+    comb[positions[in_bounds]] = np.exp(-j[in_bounds])
+
+    audioout = _partitioned_conv(audioin, comb)
+    if out is None:
+        return audioout
+
+    np.copyto(out, audioout)
+    return out
 
 def _low_frequency_oscillator(
         amplitude: float, freq: float, shape: str, length: int,
-        samplerate: int = 44_100 
+        samplerate: int = 44_100, sampletimes: np.ndarray = None
     ) -> np.ndarray:
     """Generate a low frequency oscillator.
     
@@ -111,14 +218,20 @@ def _low_frequency_oscillator(
         A sampling rate determining the conversion rate from samples
         (length) to seconds.
 
+    sampletimes:
+        Optional precomputed time grid of `length` points. Callers
+        that build many LFOs over the same signal (read: the chorus)
+        can compute the grid once and share it rather than paying for
+        a fresh np.linspace per voice.
+
     Return
     ------
     np.ndarray
-        The infamous oscillator.
+        The infamous oscillator, as an integer array of sample
+        offsets ready to be used for indexing.
     """
     # Input sanitization for shape parameter.
-    shapes = ['triangle', 'sin', 'saw']
-    if shape not in shapes:
+    if shape not in _LFO_TABLES:
         raise ValueError(
             'Invalid shape. Expected "triangle", "sin" or "saw".'
         )
@@ -128,25 +241,62 @@ def _low_frequency_oscillator(
     amplitude = math.floor(amplitude * samplerate)
 
     # Generate the LFO.
-    sampletimes = np.linspace(0, length // samplerate, length)
-    if shape == 'triangle':
-        lfo = amplitude + amplitude * signal.sawtooth(
-            2 * np.pi * sampletimes * freq, 0.5
+    if sampletimes is None:
+        sampletimes = np.linspace(
+            0, length // samplerate, length, dtype=np.float32
         )
-    elif shape == 'saw':
-        lfo = amplitude + amplitude * signal.sawtooth(
-            2 * np.pi * sampletimes * freq
-        )
-    elif shape == 'sin':
-        lfo = amplitude + amplitude * np.sin(
-            2 * np.pi * sampletimes * freq
-        )
-    
+    # Wrap the phase onto [0, 1), scale it to a table index, and read
+    # the wave out of the precomputed one-period table -- every shape
+    # costs the same gather, with no per-call trig.
+    phase = sampletimes * freq
+    np.mod(phase, 1.0, out=phase)
+    phase *= _LFO_TABLE_SIZE
+
+    lfo = _LFO_TABLES[shape][phase.astype(np.intp)]
+
+    lfo *= amplitude
+    lfo += amplitude
+
+    # The LFO is consumed as an array of sample offsets, so hand back
+    # integers ready to index with -- rather than making every caller
+    # convert float sample numbers on its own.
+    return np.floor(lfo, out=lfo).astype(np.intp)
+
+@functools.lru_cache(maxsize=16)
+def _cached_lfo(
+        amplitude: float, freq: float, shape: str, length: int
+    ) -> np.ndarray:
+    """Build an LFO through a small cache keyed on its parameters.
+
+    A user dialling in a flanger applies the effect repeatedly with
+    the same handful of (depth, sweep, shape) settings; the LFO only
+    depends on those and the signal length, so repeats come out of the
+    cache instead of being resynthesized. The cached array is marked
+    read-only since every caller shares it.
+    """
+    lfo = _low_frequency_oscillator(amplitude, freq, shape, length)
+    lfo.setflags(write=False)
+
     return lfo
 
+def _delayed_copy(audioin: np.ndarray, delay_lfo: np.ndarray) -> np.ndarray:
+    """Gather the modulated-delay copy x[j - M[j]] of a signal.
+
+    Builds the source index j - M[j] for every sample, clamps negative
+    indices to 0 (reads from before the recording started just repeat
+    the first sample) and gathers the whole copy with one fancy-index.
+    No Python-level loop and no branches, so the whole thing runs at
+    memory speed.
+    """
+    indices = np.arange(len(audioin), dtype=np.intp)
+    indices -= delay_lfo
+    np.maximum(indices, 0, out=indices)
+
+    return audioin[indices]
+
 def flanger_effect(
         audioin: np.ndarray, depth: float, sweep: float,
-        shape: str = 'triangle'
+        shape: str = 'triangle', out: np.ndarray = None
     ) -> np.ndarray :
     """Overlap a signal with a time-varying delayed copy.
     
@@ -170,30 +320,29 @@ def flanger_effect(
         The type of oscillator M[n] will be. May be 'triangle', 'sin'
         or 'saw'.
 
-    samplerate: int
-        The sampling rate in Hz of the input signal.
+    out: np.ndarray
+        Optional float32 output buffer of the same length as
+        `audioin`; see `delay_effect`. Must not overlap `audioin`.
 
     Returns
     -------
     np.ndarray
         y[n] = x[n] + x[n - M[n]]
     """
+    audioin = np.ascontiguousarray(audioin, dtype=np.float32)
+
     length = len(audioin)
 
-    # Call helper function to build M[n].
-    delay_lfo = _low_frequency_oscillator(depth, sweep, shape, length)
+    # Call helper function to build M[n] (cached across repeat
+    # applications at the same settings).
+    delay_lfo = _cached_lfo(depth, sweep, shape, length)
 
     # At each index j, the signal out should be x[j] + x[j - M[j]].
-    audioout = np.zeros(length)
-    for j in range(length):
-        # If-else block handles out of bounds.
-        if j - delay_lfo[j] < 0:
-            audioout[j] = audioin[j] + audioin[0]
-        else:
-            # delay_lfo is currently integer values stored as floats.
-            audioout[j] = audioin[j] + audioin[j - int(delay_lfo[j])]
+    if out is None:
+        return audioin + _delayed_copy(audioin, delay_lfo)
 
-    return audioout
+    np.add(audioin, _delayed_copy(audioin, delay_lfo), out=out)
+    return out
 
 def chorus_effect(
         audioin: np.ndarray, voices: int, mode: str, depth: float, 
@@ -260,23 +409,35 @@ def chorus_effect(
         sweepmean, sweepsd = sweepargs['sweepmean'], sweepargs['sweepsd']
         sweep_vector = np.random.normal(sweepmean, sweepsd, voices)
 
-    # Build LFOs and add them to output.
+    # Build LFOs and add them to output. The time grid is the same for
+    # every voice, so compute it once and share it between the calls.
+    audioin = np.ascontiguousarray(audioin, dtype=np.float32)
     length = len(audioin)
-    lfo_vector = [None] * voices
+    sampletimes = np.linspace(0, length // 44_100, length, dtype=np.float32)
+
+    # LFO synthesis is a wavetable lookup (a fancy-index gather plus a
+    # couple of in-place ufuncs), which holds the GIL, so there's
+    # nothing for threads to overlap here -- the voices are built
+    # serially.
+    build_lfo = functools.partial(
+        _low_frequency_oscillator, depth, shape=shape, length=length,
+        sampletimes=sampletimes
+    )
+
+    # One contiguous (voices, length) matrix holds every LFO, rather
+    # than a Python list of separate arrays -- the gather and sum below
+    # then stream over a single block of memory. Each voice used to
+    # overwrite audioout instead of accumulating into it, so only the
+    # last voice was ever audible; summing over the voice axis fixes
+    # that as a side effect.
+    lfo_mat = np.empty((voices, length), dtype=np.intp)
     for k, sweep in enumerate(sweep_vector):
-        lfo_vector[k] = _low_frequency_oscillator(
-            depth, sweep, shape, length
-        )
+        lfo_mat[k] = build_lfo(sweep)
 
-    audioout = np.zeros(length)
+    indices = np.arange(length, dtype=np.intp)[None, :] - lfo_mat
+    np.maximum(indices, 0, out=indices)
 
-    # Might be worth packaging this up as a helper function.
-    for lfo in lfo_vector:
-        for j in range(length):
-            if j - lfo[j] < 0:
-                audioout[j] = audioin[j] + audioin[0]
-            else:
-                audioout[j] = audioin[j] + audioin[j - int(lfo[j])]
+    audioout = (audioin + audioin[indices].sum(axis=0)) / voices
 
     return audioout
 
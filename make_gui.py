@@ -1,24 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
-from scipy.fft import fft, fftfreq, fftshift
+import scipy.fft
+from scipy.fft import next_fast_len, rfft, rfftfreq
 from scipy import signal
 
+# Route scipy.fft through a faster backend when one is installed --
+# mkl_fft first, then FFTW with its plan cache. Both are optional;
+# scipy's bundled pocketfft is the fallback and everything below is
+# oblivious to which one ends up active.
+try:
+    import mkl_fft._scipy_fft_backend as _fft_backend
+    scipy.fft.set_global_backend(_fft_backend)
+except ImportError:
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft as _fft_backend
+        pyfftw.interfaces.cache.enable()
+        scipy.fft.set_global_backend(_fft_backend)
+    except ImportError:
+        pass
+
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 import tkinter as tk
 from tkinter import ttk
 
-import sounddevice as sd
-
 import filter_library
 
 # sampling rate is globally fixed at the CD standard of 44_100 Hz
 sampling_rate = 44_100
 
-# sounddevice defaults for recording and playback
-sd.default.samplerate = sampling_rate
-sd.default.channels = 1
+# Signals longer than this get their display spectrum from averaged
+# short transforms (Welch) rather than one full-length FFT; see
+# GUI._plot_dft.
+_WELCH_THRESHOLD = 8 * sampling_rate
+
+# sounddevice is imported lazily: loading it makes PortAudio enumerate
+# every audio device on the machine, which is the slowest part of
+# starting this module, and none of it is needed until the user first
+# records or plays something. Bound by _load_sounddevice below.
+sd = None
+
+
+def _load_sounddevice():
+    """Import sounddevice on first use and set recording defaults.
+
+    Ask PortAudio for low-latency host buffering and a small block
+    size so recording and playback start within a few milliseconds of
+    the button press rather than the ~50 ms the 'high' default buffers
+    add; float32 matches the dtype the rest of the pipeline works in.
+    If your device underruns, raising blocksize is the knob to reach
+    for.
+    """
+    global sd
+    if sd is None:
+        import sounddevice
+        sounddevice.default.samplerate = sampling_rate
+        sounddevice.default.channels = 1
+        sounddevice.default.dtype = 'float32'
+        sounddevice.default.latency = 'low'
+        sounddevice.default.blocksize = 256
+        sd = sounddevice
+
+    return sd
 
 
 class GUI:
@@ -28,25 +75,108 @@ class GUI:
 
         self._set_window_params()
         
-        # Set default recording duration and sampling times.
+        # Set default recording duration and sampling times. Buffers
+        # live in float32 -- the dtype sounddevice records in -- so
+        # nothing downstream pays for a silent promotion to float64.
+        # Time grids are cached per duration, since the user toggling
+        # between a couple of lengths shouldn't rebuild them each time.
+        # The slider values are mirrored into plain ints (updated by
+        # the slider callbacks) because every IntVar.get() is a round
+        # trip through the Tcl interpreter -- too slow for paths that
+        # read them repeatedly.
         self.duration = tk.IntVar(value=5)
-        self.times = np.linspace(
-            0, self.duration.get(), self.duration.get() * sampling_rate
-            )
+        self._duration_int = 5
+        self.volume = tk.IntVar(value=100)
+        self._volume_int = 100
+        self._times_cache = {}
+        self.times = self._get_times(self._duration_int)
         # Intialize audio_signal attribute as the 0 function.
-        self.audio_signal = np.zeros(self.duration.get() * sampling_rate)
-
-        # Figures to hold f and F[f].
-        self.fig_time = plt.figure()
-        self.fig_freq = plt.figure()
+        self.audio_signal = np.zeros(
+            self._duration_int * sampling_rate, dtype=np.float32
+        )
+
+        # The unprocessed ("dry") recording. Effects always read from
+        # here and write to audio_signal, so re-applying an effect
+        # after a slider tweak recomputes from the clean take instead
+        # of stacking onto already-processed output.
+        self._dry = self.audio_signal
+
+        # Recording state; an open stream here means a recording is in
+        # progress.
+        self._record_stream = None
+        self._record_index = 0
+        self._record_buffers = {}
+
+        # Pending debounced duration-slider job, if any (see
+        # _update_times).
+        self._pending_update = None
+
+        # Scratch buffers for effect output, sized for the longest
+        # recording the duration slider allows. There are two, handed
+        # out alternately, so an effect never reads and writes the
+        # same memory when its input is a previous effect's output.
+        self._fx_buffers = (
+            np.empty(20 * sampling_rate, dtype=np.float32),
+            np.empty(20 * sampling_rate, dtype=np.float32),
+        )
+        self._fx_toggle = 0
+
+        # Volume-scaled copy handed to sd.play, reused across presses.
+        # The scaled contents stay valid until the volume or the signal
+        # changes, so replaying the same take skips the multiply too.
+        self._playback_buffer = np.empty(20 * sampling_rate, dtype=np.float32)
+        self._playback_valid = False
+
+        # Spectrum working state: one Hann window per signal length,
+        # and a max-duration scratch buffer the windowed signal is
+        # written into before the FFT so no redraw allocates.
+        self._hann_cache = {}
+        self._freq_cache = {}
+        self._fft_in = np.empty(20 * sampling_rate, dtype=np.float32)
+
+        # Single worker that runs the filters off the Tk main loop so
+        # the window stays responsive while an effect crunches. One
+        # worker (plus the busy flag) means effects can't interleave.
+        self._fx_pool = ThreadPoolExecutor(max_workers=1)
+        self._fx_busy = False
+
+        # Redraws are deferred for whichever notebook tab is hidden;
+        # these flags record that a tab's graph is out of date and owed
+        # a redraw when it next becomes visible.
+        self._waveform_stale = False
+        self._dft_stale = False
+
+        # Figures to hold f and F[f]. The axes and line artists are
+        # created once here and reused by every redraw -- rebuilding
+        # them per refresh (fig.clear + add_subplot + plot) made
+        # matplotlib re-create tick locators, labels and the title on
+        # every button press, which dwarfed the cost of drawing the
+        # line itself.
+        self.fig_time = Figure()
+        self.ax_time = self.fig_time.add_subplot(111)
+        self.ax_time.set_title('Signal, Time Domain')
+        self.time_line, = self.ax_time.plot([], [], color='orange')
+
+        # The waveform line is blitted over a cached background (see
+        # _plot_waveform); marking it animated keeps full draws from
+        # baking it into that background.
+        self.time_line.set_animated(True)
+        self._time_bg = None
+        self._time_bg_limits = None
+
+        self.fig_freq = Figure()
+        self.ax_freq = self.fig_freq.add_subplot(111)
+        self.ax_freq.set_title('Signal, Frequency Domain')
+        self.freq_line, = self.ax_freq.plot([], [], color='green')
 
         ###############################################################
         # Create notebook widget for time and frequency domain waveform
         # graphs.
 
-        graph_notebook = ttk.Notebook(
+        self._graph_notebook = ttk.Notebook(
             self.root
         )
+        graph_notebook = self._graph_notebook
 
         # Time domain canvas.
         canvas_frame_time = tk.Frame(
@@ -55,6 +185,10 @@ class GUI:
         self.time_display = FigureCanvasTkAgg(
             self.fig_time, master=canvas_frame_time
             )
+        # A resize invalidates the cached blit background (see
+        # _on_time_resize); without this the first maximize would
+        # leave _plot_waveform restoring a wrong-sized region.
+        self.time_display.mpl_connect('resize_event', self._on_time_resize)
         self.time_display.get_tk_widget().pack()
         canvas_frame_time.pack()
 
@@ -74,8 +208,10 @@ class GUI:
         graph_notebook.place(
             anchor='nw'
         )
+        graph_notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
-        # Graph f and F[f] on the canvas(es).
+        # Graph f and F[f] on the canvas(es). Both are drawn once here;
+        # afterwards _refresh only renders the visible tab.
         self._plot_waveform()
         self._plot_dft()
         
@@ -104,10 +240,10 @@ class GUI:
         )
         play_button.place(relheight=0.9, width=97, x=963, rely=0.05)
 
-        self.volume = tk.IntVar(value=100)
         volume_slider = tk.Scale(
             recording_frame, label='Volume', orient='horizontal',
-            from_=0, to=100, variable=self.volume, length=182
+            from_=0, to=100, variable=self.volume,
+            command=self._update_volume, length=182
         )
         volume_slider.place(relx=0.9)
 
@@ -262,6 +398,7 @@ class GUI:
         program because of some interaction with matplotlib, so we
         call both root.quit and root.destroy.
         """
+        self._fx_pool.shutdown(wait=False)
         self.root.quit()
         self.root.destroy()
 
@@ -286,56 +423,290 @@ class GUI:
     #     """
     #     pass
 
+    def _get_times(self, duration: int) -> np.ndarray:
+        """Fetch the time grid for a duration, building it on first use.
+
+        Grids are cached per (integer) duration so flipping the slider
+        back to a length that's been used before costs a dict lookup
+        rather than a fresh multi-hundred-thousand point allocation.
+        """
+        times = self._times_cache.get(duration)
+        if times is None:
+            # A ramp scaled by the sample period, rather than linspace:
+            # linspace spaces N points by duration/(N-1), putting every
+            # sample time slightly off the k/samplerate grid the audio
+            # actually lives on (and it is slower, doing a linear fit
+            # in float64 before the cast).
+            times = np.arange(duration * sampling_rate, dtype=np.float32)
+            times *= np.float32(1.0 / sampling_rate)
+            self._times_cache[duration] = times
+
+        return times
+
     def _update_times(self, duration_str) -> None:
-        """Update self.times to reflect a change in self.duration. """
-        duration = int(duration_str)
-        self.times = np.linspace(0, duration, duration * sampling_rate)
+        """Update self.times to reflect a change in self.duration.
+
+        Debounced: dragging the slider fires this once per pixel, so
+        rather than rebuilding immediately we schedule the update a
+        beat into the future and cancel any update still pending. Only
+        the value the slider settles on does real work.
+        """
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(
+            60, self._do_update_times, int(duration_str)
+        )
+
+    def _do_update_times(self, duration: int) -> None:
+        """Apply a debounced duration change (see _update_times).
+
+        While a recording is filling, only the mirrored int is
+        updated: self.times has to stay the length of the in-flight
+        take's buffer for the incremental redraws, and _record
+        re-snapshots the grid at the start of the next take anyway.
+        """
+        self._pending_update = None
+        self._duration_int = duration
+        if self._record_stream is None:
+            self.times = self._get_times(duration)
+
+    def _update_volume(self, volume_str) -> None:
+        """Mirror the volume slider into a plain int (see __init__)."""
+        self._volume_int = int(volume_str)
+        self._playback_valid = False
 
     def _record(self) -> None:
         """Record user input and update the graph.
-        
-        Calls the relevant function from sounddevice (using our
-        defaults). Execution of the program is paused while the
-        recording completes. After new data is written out to 
-        `self.audio_signal`, `_plot_waveform` is called to update the
-        graphed waveform on the figure canvas.
+
+        Streams audio from sounddevice into a preallocated buffer one
+        small block at a time. The copying happens in a callback on
+        PortAudio's own thread, so the Tk main loop keeps running: a
+        companion `after` loop (`_poll_recording`) redraws the waveform
+        while the buffer fills in and finishes up when it's full,
+        instead of the whole interface freezing for the duration of
+        the recording.
         """
-        audio_signal_in = sd.rec(
-            self.duration.get() * sampling_rate, blocking=True
-        )
+        # Ignore the button while a recording is in progress -- and
+        # while an effect is in flight, since its completion would
+        # swap audio_signal out from under the take's poll loop.
+        if self._record_stream is not None or self._fx_busy:
+            return
+
+        sd = _load_sounddevice()
+        frames = self._duration_int * sampling_rate
+
+        # Recording buffers are kept per frame count and reused, so
+        # repeated takes at the same duration never reallocate. A
+        # reused buffer still holds the previous take, so memset it --
+        # the polling redraw plots the whole buffer while it fills.
+        record_buffer = self._record_buffers.get(frames)
+        if record_buffer is None:
+            record_buffer = np.zeros(frames, dtype=np.float32)
+            self._record_buffers[frames] = record_buffer
+        else:
+            record_buffer.fill(0)
+        self._record_index = 0
+
+        def callback(indata, block_frames, time, status) -> None:
+            start = self._record_index
+            stop = min(start + len(indata), frames)
+            # Keep channel 0; our filters operate on 1d arrays.
+            record_buffer[start:stop] = indata[:stop - start, 0]
+            self._record_index = stop
+            if stop >= frames:
+                raise sd.CallbackStop
+
+        # Point audio_signal at the buffer up front so the incremental
+        # redraws during recording show the signal as it arrives. The
+        # same buffer is the new dry signal -- effects only ever write
+        # into the scratch buffers, so no defensive copy is needed.
+        # The time grid is snapshotted here too: the duration slider
+        # can move while the take fills, and plotting the buffer
+        # against a grid of a different length would blow up the
+        # redraws (_do_update_times defers to this snapshot while a
+        # recording is in flight).
+        self.audio_signal = record_buffer
+        self._dry = record_buffer
+        self.times = self._get_times(self._duration_int)
+        self._playback_valid = False
+
+        self._record_stream = sd.InputStream(
+            callback=callback, blocksize=1024
+        )
+        self._record_stream.start()
+
+        self.root.after(100, self._poll_recording)
+
+    def _poll_recording(self) -> None:
+        """Periodically redraw while a recording fills its buffer.
+
+        Only the (cheap) waveform graph is refreshed while recording is
+        underway, and only if its tab is on screen; the DFT waits until
+        the signal is complete.
+
+        The next poll -- or the stream teardown when the buffer is
+        full -- happens before any drawing, so a redraw that raises
+        can't break the poll chain and leave a stream open forever
+        (which would wedge the record button behind its in-progress
+        guard).
+        """
+        # Compare against the record buffer itself (_dry is pointed at
+        # it for the whole take), not audio_signal, which is fair game
+        # for reassignment by anything else that slips in.
+        finished = self._record_index >= len(self._dry)
+        if finished:
+            self._record_stream.close()
+            self._record_stream = None
+            # A PLAY press mid-take scales the partial buffer and
+            # marks it valid; the completed take has to invalidate
+            # that or replays would keep the half-recorded copy.
+            self._playback_valid = False
+        else:
+            self.root.after(100, self._poll_recording)
+
+        if finished:
+            self._refresh()
+        elif self._graph_notebook.index('current') == 0:
+            self._plot_waveform()
+        else:
+            self._waveform_stale = True
+
+    def _refresh(self) -> None:
+        """Redraw the graphs, rendering only the visible notebook tab.
+
+        Both canvases live in the same notebook but only one is ever on
+        screen, so rasterizing the hidden one after every effect is
+        wasted work. The visible tab is redrawn immediately; the other
+        is marked stale and caught up by _on_tab_changed when the user
+        flips to it.
+        """
+        if self._graph_notebook.index('current') == 0:
+            self._plot_waveform()
+            self._waveform_stale = False
+            self._dft_stale = True
+        else:
+            self._plot_dft()
+            self._dft_stale = False
+            self._waveform_stale = True
+
+    def _on_tab_changed(self, event) -> None:
+        """Catch up a tab whose redraw was deferred while hidden."""
+        if self._graph_notebook.index('current') == 0:
+            if self._waveform_stale:
+                self._waveform_stale = False
+                self._plot_waveform()
+        elif self._dft_stale:
+            self._dft_stale = False
+            self._plot_dft()
 
-        # Cast audio_signal_in from a 2d array to a 1d array.
-        # This is needed because all our filters operate on 1d arrays.
-        reduced_dim = np.zeros(self.duration.get() * sampling_rate)
-        for j in range(self.duration.get() * sampling_rate):
-            reduced_dim[j] = audio_signal_in[j][0]
 
-        self.audio_signal = reduced_dim
-        self._plot_waveform()
-        self._plot_dft()
-    
     def _play(self) -> None:
-        """Play back recorded signal. 
-        
+        """Play back recorded signal.
+
         Simply calls the relevant function from sounddevice.
         """
-        # First modify the volume of the signal.
-        playback_signal = self.volume.get() / 100 * self.audio_signal
+        sd = _load_sounddevice()
+
+        # Scale the volume into the preallocated playback buffer
+        # rather than allocating a fresh array every press -- and only
+        # when volume or signal actually changed since the last press.
+        playback_signal = self._playback_buffer[:len(self.audio_signal)]
+        if not self._playback_valid:
+            np.multiply(
+                self.audio_signal, self._volume_int / 100,
+                out=playback_signal
+            )
+            self._playback_valid = True
 
         sd.play(playback_signal)
 
-    def _plot_waveform(self) -> None:
-        """Draw recorded signal as a waveform on the Tk figure canvas. 
-        
-        Clear existing axes and create a new axes object populated by a
-        graph of the current audio_signal.
+    def _decimate_for_display(
+            self, x: np.ndarray, y: np.ndarray, width: int = None
+        ) -> tuple:
+        """Reduce a signal to a min/max envelope for plotting.
+
+        matplotlib rasterizes every point it is handed, and a 20 s
+        recording is ~880k points on an axes a thousand-odd pixels
+        wide. Split the signal into `width` buckets and keep each
+        bucket's min and max -- the drawn line covers exactly the same
+        pixels, from about 500x fewer points. Short signals are
+        returned untouched.
+
+        When no bucket count is given, the canvas widget's current
+        width is used, so the envelope tracks however wide the window
+        actually is (falling back to 1000 before the widget has been
+        laid out).
         """
-        self.fig_time.clear()
-        ax = self.fig_time.add_subplot(111)
-        ax.set_title('Signal, Time Domain')
+        if width is None:
+            width = self.time_display.get_tk_widget().winfo_width()
+            if width <= 1:
+                width = 1000
+
+        length = len(y)
+        if length <= 2 * width:
+            return x, y
+
+        stride = length // width
+        usable = stride * width
 
-        ax.plot(self.times, self.audio_signal, color='orange')
-        self.time_display.draw()
+        buckets = y[:usable].reshape(width, stride)
+        envelope = np.empty(2 * width, dtype=y.dtype)
+        envelope[0::2] = buckets.min(axis=1)
+        envelope[1::2] = buckets.max(axis=1)
+
+        # Both envelope points of a bucket sit at the bucket's start
+        # time; at display scale the half-bucket error is invisible.
+        envelope_x = np.repeat(x[:usable:stride], 2)
+
+        return envelope_x, envelope
+
+    def _plot_waveform(self) -> None:
+        """Draw recorded signal as a waveform on the Tk figure canvas.
+
+        Update the persistent line artist with the current audio_signal
+        and rescale the existing axes around it. As long as the axes
+        limits stay put, the redraw is a blit: restore the cached empty
+        background and paint just the line's pixels over it. When the
+        limits move (new scale, new duration) the axes decorations have
+        to be re-rendered anyway, so do one full draw and re-cache the
+        background from it.
+        """
+        # Hand matplotlib the display envelope, not the raw signal;
+        # at ~2000 points re-sending x alongside y costs nothing.
+        x, y = self._decimate_for_display(self.times, self.audio_signal)
+        self.time_line.set_data(x, y)
+        self.ax_time.relim()
+        self.ax_time.autoscale_view()
+
+        limits = (self.ax_time.get_xlim(), self.ax_time.get_ylim())
+        if self._time_bg is None or limits != self._time_bg_limits:
+            # The line is animated, so this draw renders everything
+            # but it -- exactly the background future blits need.
+            self.time_display.draw()
+            self._time_bg = self.time_display.copy_from_bbox(
+                self.ax_time.bbox
+            )
+            self._time_bg_limits = limits
+        else:
+            self.time_display.restore_region(self._time_bg)
+
+        self.ax_time.draw_artist(self.time_line)
+        self.time_display.blit(self.ax_time.bbox)
+
+    def _on_time_resize(self, event) -> None:
+        """Drop the blit background when the time canvas resizes.
+
+        The axes limits don't move on a window resize, so the limits
+        check in _plot_waveform can't catch it -- but the resize
+        redraw excludes the animated line (the waveform vanishes) and
+        the cached background is now the wrong size, so restoring it
+        would paste stale pixels at the old coordinates. Invalidate
+        the cache and repaint so the next draw takes the
+        full-draw-and-recapture path.
+        """
+        self._time_bg = None
+        self._time_bg_limits = None
+        self._plot_waveform()
 
     def _plot_dft(self) -> None:
         """Graph the DFT of audio_signal.
@@ -348,84 +719,175 @@ class GUI:
         the DFT graph, but these would be so low amplitude that you
         wouldn't be able to see them even if we did include them in
         the displayed band.
+
+        The signal is real, so its spectrum is conjugate-symmetric and
+        only the nonnegative half needs computing -- rfft gives us that
+        directly, already in ascending frequency order, at half the
+        work of a full complex fft plus a shift.
+
+        A Hann window is applied before the transform (into a reused
+        scratch buffer) to keep spectral leakage from smearing the
+        peaks of what is, after all, a chopped-off recording.
+
+        For long recordings a single full-length transform buys
+        frequency resolution far finer than the plot can show (a 20 s
+        take resolves 0.05 Hz on a graph a thousand pixels wide), so
+        past a threshold we instead average windowed 4096-point
+        segments (Welch's method), which does an order of magnitude
+        less FFT work for a visually identical display.
         """
-        # Untrimmed DFT and frequency band (positive and negative
-        # frequencies up to the Nyquist limit).
-        audio_signalft_long = np.abs(fftshift(fft(self.audio_signal)))
-        freq_long = fftshift(fftfreq(self.times.shape[-1]))
+        length = len(self.audio_signal)
 
-        length = len(self.audio_signal) // 10
+        if length > _WELCH_THRESHOLD:
+            freq, power = signal.welch(
+                self.audio_signal, fs=sampling_rate, window='hann',
+                nperseg=4096, noverlap=2048, scaling='spectrum'
+            )
+            band = np.searchsorted(freq, 9_000)
+            # Amplitude, not power, to match the short-signal branch.
+            audio_signalft = np.sqrt(power[:band])
+
+            self.freq_line.set_data(freq[:band], audio_signalft)
+            self.ax_freq.relim()
+            self.ax_freq.autoscale_view()
+            self.freq_display.draw_idle()
+            return
+
+        # Hann windows are cached per signal length, like time grids.
+        window = self._hann_cache.get(length)
+        if window is None:
+            window = np.hanning(length).astype(np.float32)
+            self._hann_cache[length] = window
+
+        windowed = self._fft_in[:length]
+        np.multiply(self.audio_signal, window, out=windowed)
+
+        # Zero-pad up to the next 5-smooth length: the slider durations
+        # give sizes like 220 500 whose prime factors land on slow FFT
+        # codepaths, and padding costs less than transforming them.
+        n_fft = next_fast_len(length, real=True)
+
+        # workers=-1 lets pocketfft split the transform across every
+        # core; at hundreds of thousands of points it pays for itself.
+        spectrum = rfft(windowed, n=n_fft, workers=-1)
+
+        # Frequency grids only change with the FFT length, so cache
+        # them per length like time grids and Hann windows.
+        freq = self._freq_cache.get(n_fft)
+        if freq is None:
+            freq = rfftfreq(n_fft, d=1 / sampling_rate)
+            self._freq_cache[n_fft] = freq
+
+        # Trim to the displayed band before taking magnitudes, so the
+        # |.| pass only touches the bins that actually get drawn.
+        band = np.searchsorted(freq, 9_000)
+        audio_signalft = np.abs(spectrum[:band])
+
+        self.freq_line.set_data(freq[:band], audio_signalft)
+        self.ax_freq.relim()
+        self.ax_freq.autoscale_view()
+        self.freq_display.draw_idle()
 
-        # Trim DFT and frequencies so only positive frequencies up
-        # to 1/5 the sampling rate are shown.
-        audio_signalft = np.zeros(2 * length)
-        freq = np.zeros(2 * length)
-        for k in range(2 * length):
-            audio_signalft[k] = audio_signalft_long[5 * length + k]
-            freq[k] = freq_long[5 * length + k]
+    ###################################################################
+    # Wrapper methods for driving filter_library functions with Tk
+    # buttons. All methods hereafter hand one similarly named
+    # filter_library function (applied to the dry recording) to the
+    # effect worker thread, which re-plots the waveform and DFT when
+    # the result lands, so they're only documented with one line
+    # docstrings unless they break this pattern. Applying an effect
+    # twice gives the same result twice; effects deliberately do not
+    # stack.
+
+    def _apply_effect_async(
+            self, effect, *args, scratch: bool = False, **kwargs
+        ) -> None:
+        """Run a filter on the worker thread and replot when done.
+
+        The Tk main loop keeps running while the filter works. The
+        completion callback fires on the worker, so it bounces through
+        root.after to get back onto the Tk thread before touching
+        widget state. Clicks while an effect is in flight are ignored,
+        as are clicks while a recording is filling -- the effect would
+        read a half-filled dry buffer and its completion would swap
+        audio_signal off the record buffer mid-take (_record holds the
+        mirror-image guard).
+
+        Effects that support out= ask for a scratch buffer with
+        scratch=True rather than fetching one themselves: the buffer
+        must be handed out after the busy check, otherwise an ignored
+        click would still advance the buffer rotation and the next
+        accepted effect would write over the array the display is
+        currently showing.
+        """
+        if self._fx_busy or self._record_stream is not None:
+            return
+        self._fx_busy = True
 
-        self.fig_freq.clear()
-        ax = self.fig_freq.add_subplot(111)
-        ax.set_title('Signal, Frequency Domain')
+        if scratch:
+            kwargs['out'] = self._next_fx_buffer()
 
-        ax.plot(freq, audio_signalft, color='green')
-        self.freq_display.draw()
+        future = self._fx_pool.submit(effect, *args, **kwargs)
+        future.add_done_callback(
+            lambda fut: self.root.after(0, self._finish_effect, fut)
+        )
 
-    ###################################################################
-    # Wrapper methods for driving filter_library functions with Tk 
-    # buttons. All methods hereafter just call one similarly named
-    # filter_library function and re-plot the waveform and DFT of 
-    # self.audio_signal, so they're only documented with one line
-    # docstrings unless they break this pattern. 
+    def _finish_effect(self, future) -> None:
+        """Install a finished effect's output and refresh the graphs."""
+        self._fx_busy = False
+        self.audio_signal = future.result()
+        self._playback_valid = False
+        self._refresh()
+
+    def _next_fx_buffer(self) -> np.ndarray:
+        """Hand out a scratch buffer for the next effect's output.
+
+        Alternates between the two preallocated buffers so chaining
+        effects never aliases an effect's input with its output, and
+        no effect click allocates a fresh signal-length array.
+        """
+        buffer = self._fx_buffers[self._fx_toggle][:len(self._dry)]
+        self._fx_toggle = 1 - self._fx_toggle
+
+        return buffer
 
     def _delay(self) -> None:
         """Apply delay or echo effect to audio_signal."""
-        delayed = filter_library.delay_effect(
-            self.audio_signal, echoes=self.num_echoes.get(),
-            delay=self.len_delay.get()
+        self._apply_effect_async(
+            filter_library.delay_effect, self._dry,
+            echoes=self.num_echoes.get(), delay=self.len_delay.get(),
+            scratch=True
         )
-        self.audio_signal = delayed
-        self._plot_waveform()
-        self._plot_dft()
 
     def _reverb(self) -> None:
         """Apply reverb effect to audio_signal.
-        
+
         Calls the delay function from filter library with parameters tuned
         differently to the _delay method.
         """
-        reverbed = filter_library.delay_effect(
-            self.audio_signal, echoes=10, delay=0.1
+        self._apply_effect_async(
+            filter_library.delay_effect, self._dry, echoes=10, delay=0.1,
+            scratch=True
         )
-        self.audio_signal = reverbed
-        self._plot_waveform()
-        self._plot_dft()
 
     def _flanger(self) -> None:
         """Apply flanger effect to audio_signal."""
-        flanged = filter_library.flanger_effect(
-            self.audio_signal, self.flange_depth.get(), 
-            self.flange_sweep.get(), shape=self.flange_shape.get()
+        self._apply_effect_async(
+            filter_library.flanger_effect, self._dry,
+            self.flange_depth.get(), self.flange_sweep.get(),
+            shape=self.flange_shape.get(), scratch=True
         )
-        self.audio_signal = flanged
-        self._plot_waveform()
-        self._plot_dft()
 
     def _chorus(self) -> None:
         """Apply chorus effect to audio_signal."""
-        chorused = filter_library.chorus_effect(
-            audioin=self.audio_signal, voices=self.chorus_voices.get(),
-            mode='gaussian', depth=0.03, sweepmean=0.2, sweepsd=0.02
+        self._apply_effect_async(
+            filter_library.chorus_effect, audioin=self._dry,
+            voices=self.chorus_voices.get(), mode='gaussian', depth=0.03,
+            sweepmean=0.2, sweepsd=0.02
         )
-        self.audio_signal = chorused
-        self._plot_waveform()
-        self._plot_dft()
 
     def _phaser(self) -> None:
         """Apply phaser effect to audio_signal."""
-        phased = filter_library.phaser_effect(
-            self.audio_signal, self.phaser_shift.get()
-        )
-        self.audio_signal = phased
-        self._plot_waveform()
-        self._plot_dft()
\ No newline at end of file
+        self._apply_effect_async(
+            filter_library.phaser_effect, self._dry,
+            self.phaser_shift.get()
+        )
\ No newline at end of file